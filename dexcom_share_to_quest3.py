@@ -2,17 +2,26 @@
 from __future__ import annotations
 
 import argparse
+import atexit
 import base64
+import functools
 import json
 import os
 import time
 import getpass
+import hashlib
 import socket
 import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
 
 def dependency_error(package_name: str) -> SystemExit:
     return SystemExit(
@@ -21,7 +30,20 @@ def dependency_error(package_name: str) -> SystemExit:
 
 
 OSCQUERY_SERVICE_TYPE = "_oscjson._tcp.local."
+KEYRING_SERVICE = "dexcom-osc-bridge"
+MASTER_PASSPHRASE_ENV = "DEXCOM_MASTER_PASSPHRASE"
+MAX_POLL_BACKOFF_S = 300
+MAX_IDLE_POLL_S = 300
+QUEST_ENDPOINT_CACHE_TTL_S = 24 * 60 * 60
 _BUILD_ID: str | None = None
+# Which constructor shape in create_dexcom_client() the installed pydexcom accepted last time.
+_DEXCOM_KWARGS_INDEX: int | None = None
+_HTTP_POOL: Any = None
+# Imported on first use so `--help` and `setup` errors don't need every dependency installed.
+_FERNET_CLS: Any = None
+_DEXCOM_CLS: Any = None
+# Last parsed credential file, keyed by (resolved path, mtime_ns, size, inode).
+_CRED_CACHE: tuple[tuple[Any, ...], dict[str, Any]] | None = None
 
 
 def resolve_build_id() -> str:
@@ -71,6 +93,19 @@ def format_auth_troubleshooting(username: str, region: str, error: Exception) ->
     )
 
 
+def _json_loads(data: bytes) -> Any:
+    # orjson is optional: faster, and it parses UTF-8 bytes without a separate decode step.
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_pretty(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
 def default_cred_path() -> Path:
     if os.name == "nt":
         appdata = os.environ.get("APPDATA")
@@ -82,49 +117,139 @@ def default_cred_path() -> Path:
     return cfg_dir / "dexcom_credentials.json"
 
 
+def _fernet_cls() -> Any:
+    global _FERNET_CLS
+    if _FERNET_CLS is None:
+        try:
+            from cryptography.fernet import Fernet
+        except ModuleNotFoundError as exc:
+            raise dependency_error("cryptography") from exc
+        _FERNET_CLS = Fernet
+    return _FERNET_CLS
+
+
+@functools.lru_cache(maxsize=8)
+def _derive_fernet_key_cached(master_bytes: bytes, salt: bytes) -> bytes:
+    # Same output as cryptography's PBKDF2HMAC(SHA256, 32, salt, 200k), but runs in OpenSSL's C loop.
+    dk = hashlib.pbkdf2_hmac("sha256", master_bytes, salt, 200_000, 32)
+    return base64.urlsafe_b64encode(dk)
+
+
+# Don't keep passphrase-derived keys around longer than the process needs them.
+atexit.register(_derive_fernet_key_cached.cache_clear)
+
+
 def derive_fernet_key(master_passphrase: str, salt: bytes) -> bytes:
-    try:
-        from cryptography.hazmat.primitives import hashes
-        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-    except ModuleNotFoundError as exc:
-        raise dependency_error("cryptography") from exc
+    return _derive_fernet_key_cached(master_passphrase.encode("utf-8"), salt)
 
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=200_000,
-    )
-    return base64.urlsafe_b64encode(kdf.derive(master_passphrase.encode("utf-8")))
 
+def _fernet_for(master_passphrase: str, salt: bytes) -> Any:
+    return _fernet_cls()(derive_fernet_key(master_passphrase, salt))
 
-def encrypt_password(password: str, master_passphrase: str) -> dict[str, str]:
-    try:
-        from cryptography.fernet import Fernet
-    except ModuleNotFoundError as exc:
-        raise dependency_error("cryptography") from exc
 
+def encrypt_password(password: str, master_passphrase: str) -> dict[str, str]:
     salt = os.urandom(16)
-    key = derive_fernet_key(master_passphrase, salt)
-    token = Fernet(key).encrypt(password.encode("utf-8"))
+    token = _fernet_for(master_passphrase, salt).encrypt(password.encode("utf-8"))
     return {
         "salt_b64": base64.b64encode(salt).decode("ascii"),
         "pw_token": token.decode("ascii"),
     }
 
 
-def decrypt_password(blob: dict[str, str], master_passphrase: str) -> str:
-    try:
-        from cryptography.fernet import Fernet
-    except ModuleNotFoundError as exc:
-        raise dependency_error("cryptography") from exc
+def decrypt_password_with_key(blob: dict[str, str], key: bytes) -> str:
+    pw = _fernet_cls()(key).decrypt(blob["pw_token"].encode("ascii"))
+    return pw.decode("utf-8")
 
+
+def decrypt_password(blob: dict[str, str], master_passphrase: str) -> str:
     salt = base64.b64decode(blob["salt_b64"])
-    key = derive_fernet_key(master_passphrase, salt)
-    pw = Fernet(key).decrypt(blob["pw_token"].encode("ascii"))
+    pw = _fernet_for(master_passphrase, salt).decrypt(blob["pw_token"].encode("ascii"))
     return pw.decode("utf-8")
 
 
+def cached_key_path(cred_path: Path) -> Path:
+    return cred_path.with_name(cred_path.stem + ".key_cache.json")
+
+
+def _keyring_module() -> Any:
+    # keyring is optional; without it the key itself goes into the 0o600 cache file next to the credentials.
+    try:
+        import keyring
+    except ModuleNotFoundError:
+        return None
+    return keyring
+
+
+def _read_cache_entry(cred_path: Path) -> dict[str, Any] | None:
+    try:
+        entry = json.loads(cached_key_path(cred_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def load_cached_key(cred_path: Path, username: str, salt_b64: str) -> bytes | None:
+    # The cache file only exists after --remember-key, so users who never opted in don't touch the keyring.
+    entry = _read_cache_entry(cred_path)
+    if entry is None or entry.get("salt_b64") != salt_b64:
+        return None
+    if entry.get("store") == "keyring":
+        keyring = _keyring_module()
+        if keyring is None:
+            return None
+        try:
+            key_b64 = keyring.get_password(KEYRING_SERVICE, username)
+        except Exception:
+            return None
+    else:
+        key_b64 = entry.get("key_b64")
+    if not key_b64:
+        return None
+    return str(key_b64).encode("ascii")
+
+
+def _write_cache_entry(cred_path: Path, entry: dict[str, str]) -> None:
+    path = cached_key_path(cred_path)
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry))
+        os.chmod(path, 0o600)
+    except OSError:
+        pass
+
+
+def store_cached_key(cred_path: Path, username: str, salt_b64: str, key: bytes) -> None:
+    keyring = _keyring_module()
+    if keyring is not None:
+        try:
+            keyring.set_password(KEYRING_SERVICE, username, key.decode("ascii"))
+            _write_cache_entry(cred_path, {"salt_b64": salt_b64, "store": "keyring"})
+            return
+        except Exception:
+            pass
+    print(
+        "Warning: no usable OS keyring; caching the key in a plain file. "
+        f"Anyone who can read {cached_key_path(cred_path)} can recover your Dexcom password."
+    )
+    _write_cache_entry(cred_path, {"salt_b64": salt_b64, "store": "file", "key_b64": key.decode("ascii")})
+
+
+def clear_cached_key(cred_path: Path, username: str) -> None:
+    entry = _read_cache_entry(cred_path)
+    if entry is not None and entry.get("store") == "keyring":
+        keyring = _keyring_module()
+        if keyring is not None:
+            try:
+                keyring.delete_password(KEYRING_SERVICE, username)
+            except Exception:
+                pass
+    try:
+        cached_key_path(cred_path).unlink()
+    except OSError:
+        pass
+
+
 def save_credentials(path: Path, region: str, username: str, encrypted_pw_blob: dict[str, str]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     payload = {
@@ -133,62 +258,125 @@ def save_credentials(path: Path, region: str, username: str, encrypted_pw_blob:
         "username": username,
         "encrypted_password": encrypted_pw_blob,
     }
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    # Write and fsync a private temp file, then rename it over the target, so a crash or power loss
+    # never leaves a truncated credential file and the contents are never readable under a permissive umask.
+    tmp = path.with_suffix(path.suffix + ".tmp")
     try:
-        os.chmod(path, 0o600)
-    except OSError:
-        pass
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(_json_dumps_pretty(payload))
+            handle.flush()
+            os.fsync(handle.fileno())
+        try:
+            os.chmod(tmp, 0o600)
+        except OSError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def load_credentials(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    global _CRED_CACHE
+    st = path.stat()
+    cache_key = (str(path.resolve()), st.st_mtime_ns, st.st_size, st.st_ino)
+    if _CRED_CACHE is not None and _CRED_CACHE[0] == cache_key:
+        return _CRED_CACHE[1]
+    cfg = _json_loads(path.read_bytes())
+    _CRED_CACHE = (cache_key, cfg)
+    return cfg
+
+
+_ARROWS = {
+    "doubleup": "↑↑",
+    "singleup": "↑",
+    "fortyfiveup": "↗",
+    "flat": "→",
+    "fortyfivedown": "↘",
+    "singledown": "↓",
+    "doubledown": "↓↓",
+}
+_ARROW_STRIP = str.maketrans("", "", "_- ")
 
 
 def arrow(direction: str | None) -> str:
     if not direction:
         return ""
-    d = direction.lower().replace("_", "").replace("-", "").replace(" ", "")
-    return {
-        "doubleup": "↑↑",
-        "singleup": "↑",
-        "fortyfiveup": "↗",
-        "flat": "→",
-        "fortyfivedown": "↘",
-        "singledown": "↓",
-        "doubledown": "↓↓",
-    }.get(d, "")
+    return _ARROWS.get(direction.lower().translate(_ARROW_STRIP), "")
+
+
+_REGION_ALIASES: dict[str, str] = {
+    **{alias: "us" for alias in ("us", "usa", "unitedstates", "united_states")},
+    **{
+        alias: "ous"
+        for alias in ("ous", "outside", "outside-us", "outside_of_us", "outsideofus", "eu", "europe", "uk")
+    },
+    **{alias: "jp" for alias in ("jp", "japan")},
+}
 
 
 def normalize_region(region: str) -> str:
-    r = (region or "").lower().strip()
-    if r in ("us", "usa", "unitedstates", "united_states"):
-        return "us"
-    if r in ("ous", "outside", "outside-us", "outside_of_us", "outsideofus", "eu", "europe", "uk"):
-        return "ous"
-    if r in ("jp", "japan"):
-        return "jp"
-    raise SystemExit("Region must be one of: us, ous, jp")
+    try:
+        return _REGION_ALIASES[(region or "").lower().strip()]
+    except KeyError:
+        raise SystemExit("Region must be one of: us, ous, jp") from None
 
 
-def create_dexcom_client(username: str, password: str, region: str) -> Any:
+def _pool_dexcom_session(dex: Any) -> None:
+    # pydexcom keeps a requests.Session; mount a small keep-alive pool so polls reuse one TLS connection.
+    session = getattr(dex, "_session", None) or getattr(dex, "session", None)
+    if session is None or not callable(getattr(session, "mount", None)):
+        return
     try:
-        from pydexcom import Dexcom
-    except ModuleNotFoundError as exc:
-        raise dependency_error("pydexcom") from exc
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+    except ModuleNotFoundError:
+        return
+
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=2,
+        max_retries=Retry(total=3, backoff_factor=0.5),
+    )
+    session.mount("https://", adapter)
+
+
+def _dexcom_cls() -> Any:
+    global _DEXCOM_CLS
+    if _DEXCOM_CLS is None:
+        try:
+            from pydexcom import Dexcom
+        except ModuleNotFoundError as exc:
+            raise dependency_error("pydexcom") from exc
+        _DEXCOM_CLS = Dexcom
+    return _DEXCOM_CLS
 
+
+def create_dexcom_client(username: str, password: str, region: str) -> Any:
+    global _DEXCOM_KWARGS_INDEX
+    Dexcom = _dexcom_cls()
     attempts = [
         {"region": region},
         {"region": region.upper()},
         {"ous": region == "ous", "jp": region == "jp"},
         {"ous": region == "ous"},
     ]
+    order = list(range(len(attempts)))
+    if _DEXCOM_KWARGS_INDEX is not None:
+        order.remove(_DEXCOM_KWARGS_INDEX)
+        order.insert(0, _DEXCOM_KWARGS_INDEX)
     errors: list[str] = []
-    for extra_kwargs in attempts:
+    for index in order:
+        extra_kwargs = attempts[index]
         try:
-            return Dexcom(username=username, password=password, **extra_kwargs)
+            dex = Dexcom(username=username, password=password, **extra_kwargs)
         except TypeError as exc:
             errors.append(f"{extra_kwargs}: {exc}")
             continue
+        _DEXCOM_KWARGS_INDEX = index
+        _pool_dexcom_session(dex)
+        return dex
     raise RuntimeError(f"Unsupported pydexcom constructor signature. Tried: {' | '.join(errors)}")
 
 
@@ -201,6 +389,9 @@ def verify_dexcom_share_login(username: str, password: str, region: str) -> None
         pass
 
 
+_READING_VALUE_ATTRS = ("value", "mg_dl", "mgdl", "glucose")
+
+
 def reading_value(reading: Any) -> int:
     if reading is None:
         raise RuntimeError("No glucose reading returned.")
@@ -208,9 +399,10 @@ def reading_value(reading: Any) -> int:
         return int(reading)
     if isinstance(reading, str):
         return int(float(reading))
-    for attr in ("value", "mg_dl", "mgdl", "glucose"):
-        if hasattr(reading, attr):
-            return int(getattr(reading, attr))
+    for attr in _READING_VALUE_ATTRS:
+        value = getattr(reading, attr, None)
+        if value is not None:
+            return int(value)
     raise RuntimeError(f"Unexpected glucose reading type: {type(reading)!r}")
 
 
@@ -247,18 +439,39 @@ def _first_ipv4_from_service_info(info: Any) -> str | None:
     return None
 
 
-def _query_host_info(ip: str, tcp_port: int, timeout: float = 1.5) -> dict[str, Any]:
-    from urllib.request import urlopen
+def _http_pool() -> Any:
+    # urllib3 ships with pydexcom's requests dependency; without it HOST_INFO falls back to urlopen.
+    global _HTTP_POOL
+    if _HTTP_POOL is None:
+        try:
+            import urllib3
+        except ModuleNotFoundError:
+            return None
+        _HTTP_POOL = urllib3.PoolManager(num_pools=4, maxsize=8, retries=False)
+    return _HTTP_POOL
+
 
+def _fetch_url(url: str, timeout: float) -> bytes:
+    pool = _http_pool()
+    if pool is None:
+        from urllib.request import urlopen
+
+        with urlopen(url, timeout=timeout) as response:
+            return response.read()
+    response = pool.request("GET", url, timeout=timeout)
+    if response.status >= 400:
+        raise RuntimeError(f"HTTP {response.status} from {url}")
+    return response.data
+
+
+def _query_host_info(ip: str, tcp_port: int, timeout: float = 1.5) -> dict[str, Any]:
     urls = [
         f"http://{ip}:{tcp_port}?HOST_INFO",
         f"http://{ip}:{tcp_port}/?HOST_INFO",
     ]
     for url in urls:
         try:
-            with urlopen(url, timeout=timeout) as response:
-                payload = response.read().decode("utf-8", errors="replace")
-            data = json.loads(payload)
+            data = _json_loads(_fetch_url(url, timeout))
             if isinstance(data, dict):
                 return data
         except Exception:
@@ -266,7 +479,40 @@ def _query_host_info(ip: str, tcp_port: int, timeout: float = 1.5) -> dict[str,
     return {}
 
 
-def detect_vrchat_osc_endpoint(timeout_s: float) -> tuple[str, int] | None:
+def _oscquery_candidate(name: str, service_ip: str, query_port: int, host_info: dict[str, Any]) -> dict[str, Any]:
+    host_name = str(host_info.get("NAME", ""))
+    osc_ip = str(host_info.get("OSC_IP", "")).strip()
+    osc_port = host_info.get("OSC_PORT")
+    try:
+        osc_port_val = int(osc_port) if osc_port is not None else 9000
+    except (TypeError, ValueError):
+        osc_port_val = 9000
+
+    target_ip = osc_ip or service_ip
+    if target_ip.startswith("127.") and not service_ip.startswith("127."):
+        target_ip = service_ip
+
+    service_name_l = name.lower()
+    host_name_l = host_name.lower()
+    score = 0
+    if "vrchat" in service_name_l:
+        score += 100
+    if "vrchat" in host_name_l:
+        score += 80
+    if not target_ip.startswith("127."):
+        score += 40
+
+    return {
+        "score": score,
+        "target_ip": target_ip,
+        "osc_port": osc_port_val,
+        "name": name,
+        "service_ip": service_ip,
+        "query_port": query_port,
+    }
+
+
+def discover_vrchat_oscquery(timeout_s: float) -> dict[str, Any] | None:
     try:
         from zeroconf import ServiceBrowser, ServiceListener, Zeroconf
     except ModuleNotFoundError as exc:
@@ -298,59 +544,76 @@ def detect_vrchat_osc_endpoint(timeout_s: float) -> tuple[str, int] | None:
     try:
         time.sleep(max(timeout_s, 0.5))
         names = collector.snapshot()
-        candidates: list[dict[str, Any]] = []
-        for name in names:
+
+        def probe(name: str) -> dict[str, Any] | None:
             info = zc.get_service_info(OSCQUERY_SERVICE_TYPE, name, timeout=1000)
             if info is None:
-                continue
+                return None
             service_ip = _first_ipv4_from_service_info(info)
             if not service_ip:
-                continue
-            host_info = _query_host_info(service_ip, int(info.port))
-            host_name = str(host_info.get("NAME", ""))
-            osc_ip = str(host_info.get("OSC_IP", "")).strip()
-            osc_port = host_info.get("OSC_PORT")
-            try:
-                osc_port_val = int(osc_port) if osc_port is not None else 9000
-            except (TypeError, ValueError):
-                osc_port_val = 9000
-
-            target_ip = osc_ip or service_ip
-            if target_ip.startswith("127.") and not service_ip.startswith("127."):
-                target_ip = service_ip
-
-            service_name_l = name.lower()
-            host_name_l = host_name.lower()
-            score = 0
-            if "vrchat" in service_name_l:
-                score += 100
-            if "vrchat" in host_name_l:
-                score += 80
-            if not target_ip.startswith("127."):
-                score += 40
-
-            candidates.append(
-                {
-                    "score": score,
-                    "target_ip": target_ip,
-                    "osc_port": osc_port_val,
-                }
-            )
+                return None
+            query_port = int(info.port)
+            host_info = _query_host_info(service_ip, query_port)
+            return _oscquery_candidate(name, service_ip, query_port, host_info)
+
+        candidates: list[dict[str, Any]] = []
+        if names:
+            # Resolve services and query HOST_INFO concurrently so discovery costs the slowest lookup, not the sum.
+            with ThreadPoolExecutor(max_workers=min(len(names), 8)) as pool:
+                candidates = [c for c in pool.map(probe, names) if c is not None]
 
         if not candidates:
             return None
-        best = max(candidates, key=lambda item: item["score"])
-        return str(best["target_ip"]), int(best["osc_port"])
+        return max(candidates, key=lambda item: item["score"])
     finally:
         zc.close()
 
 
-def resolve_quest_endpoint(quest_ip: str, quest_port: int, timeout_s: float) -> tuple[str, int]:
+def _probe_cached_oscquery(cache_path: Path) -> dict[str, Any] | None:
+    try:
+        cached = _json_loads(cache_path.read_bytes())
+        if time.time() - float(cached["ts"]) > QUEST_ENDPOINT_CACHE_TTL_S:
+            return None
+        service_ip = str(cached["ip"])
+        query_port = int(cached["port"])
+        name = str(cached.get("name", ""))
+    except Exception:
+        return None
+    # VRChat picks a new OSCQuery port each launch, so this only hits while the same session is running.
+    host_info = _query_host_info(service_ip, query_port, timeout=0.3)
+    if "vrchat" not in str(host_info.get("NAME", "")).lower():
+        return None
+    return _oscquery_candidate(name, service_ip, query_port, host_info)
+
+
+def _store_cached_oscquery(cache_path: Path, candidate: dict[str, Any]) -> None:
+    entry = {
+        "ip": candidate["service_ip"],
+        "port": candidate["query_port"],
+        "name": candidate["name"],
+        "ts": time.time(),
+    }
+    try:
+        cache_path.write_bytes(_json_dumps_pretty(entry))
+    except OSError:
+        pass
+
+
+def resolve_quest_endpoint(
+    quest_ip: str,
+    quest_port: int,
+    timeout_s: float,
+    cache_path: Path | None = None,
+) -> tuple[str, int]:
     requested = (quest_ip or "").strip()
     if requested and requested.lower() not in ("auto", "oscquery"):
         return requested, quest_port
 
-    detected = detect_vrchat_osc_endpoint(timeout_s=timeout_s)
+    detected = _probe_cached_oscquery(cache_path) if cache_path is not None else None
+    if detected is None:
+        detected = discover_vrchat_oscquery(timeout_s=timeout_s)
+        if detected is not None and cache_path is not None:
+            _store_cached_oscquery(cache_path, detected)
     if not detected:
         raise SystemExit(
             "Could not auto-detect VRChat via OSCQuery.\n"
@@ -358,8 +621,34 @@ def resolve_quest_endpoint(quest_ip: str, quest_port: int, timeout_s: float) ->
             "Then retry with --quest-ip auto or pass --quest-ip manually."
         )
 
-    detected_ip, _detected_port = detected
-    return detected_ip, quest_port
+    return str(detected["target_ip"]), quest_port
+
+
+def _osc_pad(data: bytes) -> bytes:
+    # OSC strings are NUL-terminated and padded to a 4-byte boundary.
+    return data + b"\0" * (4 - len(data) % 4)
+
+
+_OSC_CHATBOX_ADDR = _osc_pad(b"/chatbox/input")
+_OSC_TYPETAGS = {True: _osc_pad(b",sT"), False: _osc_pad(b",sF")}
+
+
+# Only a few hundred BG values times 7 arrows ever occur, so both text and packet are memoized.
+@functools.lru_cache(maxsize=512)
+def _chatbox_text(bg: int, dir_arrow: str) -> str:
+    return f"BG {bg} {dir_arrow}" if dir_arrow else f"BG {bg}"
+
+
+@functools.lru_cache(maxsize=512)
+def build_chatbox_packet(text: str, immediate: bool = True) -> bytes:
+    return b"".join((_OSC_CHATBOX_ADDR, _OSC_TYPETAGS[immediate], _osc_pad(text.encode("utf-8"))))
+
+
+def open_osc_socket(host: str, port: int) -> tuple[socket.socket, Any]:
+    family, _type, _proto, _canon, sockaddr = socket.getaddrinfo(host, port, type=socket.SOCK_DGRAM)[0]
+    sock = socket.socket(family, socket.SOCK_DGRAM)
+    sock.setblocking(False)
+    return sock, sockaddr
 
 
 def cmd_setup(args: argparse.Namespace) -> None:
@@ -395,15 +684,23 @@ def cmd_setup(args: argparse.Namespace) -> None:
 
     enc_blob = encrypt_password(dex_pw, master1)
     save_credentials(cred_path, region, username, enc_blob)
+    clear_cached_key(cred_path, username)
     print(f"Saved encrypted credentials to: {cred_path}")
 
 
-def cmd_run(args: argparse.Namespace) -> None:
-    try:
-        from pythonosc.udp_client import SimpleUDPClient
-    except ModuleNotFoundError as exc:
-        raise dependency_error("python-osc") from exc
+def noninteractive_master_passphrase(passphrase_fd: int | None) -> str | None:
+    # For services: like gpg --passphrase-fd, read one line from an inherited fd; else the env var.
+    if passphrase_fd is not None:
+        try:
+            with os.fdopen(passphrase_fd, "rb", closefd=False) as handle:
+                line = handle.readline(4096)
+        except OSError as exc:
+            raise SystemExit(f"Could not read master passphrase from fd {passphrase_fd}: {exc}") from exc
+        return line.decode("utf-8").strip() or None
+    return os.environ.get(MASTER_PASSPHRASE_ENV, "").strip() or None
 
+
+def cmd_run(args: argparse.Namespace) -> None:
     cred_path = Path(args.cred_file).expanduser()
     if not cred_path.exists():
         raise SystemExit(f"Credential file not found: {cred_path}\nRun: {Path(__file__).name} setup")
@@ -412,14 +709,38 @@ def cmd_run(args: argparse.Namespace) -> None:
     region = normalize_region(cfg["region"])
     username = cfg["username"]
 
-    master = getpass.getpass("Master passphrase (hidden): ").strip()
-    try:
-        password = decrypt_password(cfg["encrypted_password"], master)
-    except Exception as exc:
-        raise SystemExit(
-            "Failed to decrypt stored Dexcom password. "
-            "Re-run setup and ensure you use the same master passphrase."
-        ) from exc
+    blob = cfg["encrypted_password"]
+    if args.forget_key:
+        clear_cached_key(cred_path, username)
+    password: str | None = None
+    cached_key = load_cached_key(cred_path, username, blob["salt_b64"])
+    if cached_key is not None:
+        try:
+            password = decrypt_password_with_key(blob, cached_key)
+        except Exception:
+            clear_cached_key(cred_path, username)
+
+    if password is None:
+        salt = base64.b64decode(blob["salt_b64"])
+        master = noninteractive_master_passphrase(args.passphrase_fd)
+        if master:
+            try:
+                key = derive_fernet_key(master, salt)
+                password = decrypt_password_with_key(blob, key)
+            except Exception:
+                print("Supplied master passphrase did not decrypt the stored password; asking interactively.")
+        if password is None:
+            master = getpass.getpass("Master passphrase (hidden): ").strip()
+            try:
+                key = derive_fernet_key(master, salt)
+                password = decrypt_password_with_key(blob, key)
+            except Exception as exc:
+                raise SystemExit(
+                    "Failed to decrypt stored Dexcom password. "
+                    "Re-run setup and ensure you use the same master passphrase."
+                ) from exc
+        if args.remember_key:
+            store_cached_key(cred_path, username, blob["salt_b64"], key)
 
     try:
         dex = create_dexcom_client(username=username, password=password, region=region)
@@ -432,33 +753,63 @@ def cmd_run(args: argparse.Namespace) -> None:
         quest_ip=args.quest_ip,
         quest_port=args.quest_port,
         timeout_s=args.oscquery_timeout,
+        cache_path=cred_path.parent / "quest_endpoint.json",
     )
-    client = SimpleUDPClient(quest_ip, quest_port)
+    osc_sock, osc_addr = open_osc_socket(quest_ip, quest_port)
     last_bg = None
+    last_msg: str | None = None
     print(f"dexcom-osc-bridge build: {build_id}")
     print(
         "Running Dexcom(Share)->OSC: "
         f"Quest {quest_ip}:{quest_port} interval={args.interval}s min_delta={args.min_delta}"
     )
 
+    backoff = args.interval
+    max_backoff = max(MAX_POLL_BACKOFF_S, args.interval)
+    max_idle_interval = max(args.interval, min(args.interval * 6, MAX_IDLE_POLL_S))
+    last_reading_key: tuple[Any, ...] | None = None
+    same_count = 0
     while True:
+        poll_started = time.monotonic()
         try:
+            if dex is None:
+                dex = create_dexcom_client(username=username, password=password, region=region)
             reading = dex.get_current_glucose_reading()
+        except Exception as exc:
+            # Drop the client so the next attempt logs in again with a fresh session.
+            dex = None
+            print(f"Error: {exc} (retrying in {min(backoff, max_backoff)}s)")
+            time.sleep(min(backoff, max_backoff))
+            backoff *= 2
+            continue
+        backoff = args.interval
+
+        try:
             bg = reading_value(reading)
             trend = reading_trend(dex, reading)
             dir_arrow = arrow(trend)
 
-            if last_bg is None or abs(bg - last_bg) >= args.min_delta:
-                msg = f"BG {bg} {dir_arrow}".strip()
-                client.send_message("/chatbox/input", [msg, True])
+            reading_key = (bg, dir_arrow, getattr(reading, "datetime", None))
+            same_count = min(same_count + 1, 16) if reading_key == last_reading_key else 0
+            last_reading_key = reading_key
+
+            msg = _chatbox_text(bg, dir_arrow)
+            # Resending identical text still makes VRChat reopen the chatbox, so skip exact repeats.
+            if msg != last_msg and (last_bg is None or abs(bg - last_bg) >= args.min_delta):
+                osc_sock.sendto(build_chatbox_packet(msg), osc_addr)
                 print("Sent:", msg)
                 last_bg = bg
+                last_msg = msg
             else:
                 print("No significant change:", bg)
         except Exception as exc:
             print("Error:", exc)
+            same_count = 0
 
-        time.sleep(args.interval)
+        # Share only publishes a new value every ~5 minutes; stretch the wait while readings repeat.
+        # The delay counts from when this poll started, so fetch latency doesn't drift the cadence.
+        delay = min(args.interval * (1.5 ** same_count), max_idle_interval)
+        time.sleep(max(0.0, delay - (time.monotonic() - poll_started)))
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -510,6 +861,22 @@ def build_parser() -> argparse.ArgumentParser:
     )
     s_run.add_argument("--interval", type=int, default=30)
     s_run.add_argument("--min-delta", type=int, default=2)
+    s_run.add_argument(
+        "--remember-key",
+        action="store_true",
+        help="Cache the derived key (OS keyring, else a 0o600 file) so later runs skip the passphrase prompt",
+    )
+    s_run.add_argument(
+        "--passphrase-fd",
+        type=int,
+        default=None,
+        help=f"Read the master passphrase from this file descriptor (otherwise ${MASTER_PASSPHRASE_ENV} is used if set)",
+    )
+    s_run.add_argument(
+        "--forget-key",
+        action="store_true",
+        help="Delete any cached key and ask for the master passphrase again",
+    )
     s_run.set_defaults(func=cmd_run)
 
     return parser
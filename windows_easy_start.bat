@@ -62,7 +62,7 @@ if errorlevel 1 goto :fail
 :have_venv
 set "VENV_PY=.venv\Scripts\python.exe"
 
-"%VENV_PY%" -c "import cryptography, pythonosc, pydexcom, zeroconf" >nul 2>nul
+"%VENV_PY%" -c "import cryptography, pydexcom, zeroconf" >nul 2>nul
 if not errorlevel 1 goto :deps_ok
 
 echo Installing dependencies...
@@ -72,7 +72,7 @@ if errorlevel 1 goto :fail
 "%VENV_PY%" -m pip install -r requirements.txt
 if errorlevel 1 (
   echo Standard install failed. Trying pydexcom GitHub fallback...
-  "%VENV_PY%" -m pip install python-osc cryptography zeroconf "git+https://github.com/gagebenne/pydexcom"
+  "%VENV_PY%" -m pip install cryptography zeroconf "git+https://github.com/gagebenne/pydexcom"
   if errorlevel 1 goto :fail
 )
 